@@ -1,11 +1,134 @@
-import requests
-import json
+import asyncio
+import functools
+import httpx
+import orjson
+import re
+import sqlite3
 import time
+from aiolimiter import AsyncLimiter
 from typing import List, Dict, Optional
 
 # === CONFIGURATION ===
 GOOGLE_BOOKS_API_BASE = "https://www.googleapis.com/books/v1/volumes"
-REQUEST_DELAY = 0.5  # Delay between requests to avoid rate limiting
+REQUEST_TIMEOUT = 10  # Seconds before a request is abandoned
+MAX_CONNECTIONS = 20  # Size of the shared connection pool
+MAX_CONCURRENT_REQUESTS = 8  # Requests allowed in flight at once
+RATE_LIMIT_REQUESTS = 60  # Token bucket size: requests allowed per period
+RATE_LIMIT_PERIOD = 60  # Token bucket refill period in seconds
+CACHE_DB_PATH = "google_books_cache.db"  # Lookup cache kept across runs
+NOT_FOUND_CACHE_TTL = 7 * 24 * 60 * 60  # Seconds before a "not found" result is looked up again
+
+LEADING_ARTICLE = re.compile(r"^(?:the|an|a)\s+")
+NON_WORD = re.compile(r"[\W_]+")  # Unicode-aware: keeps letters and digits of any script
+ISBN_TYPES = frozenset(("ISBN_13", "ISBN_10"))
+
+CACHE_MISS = object()  # Sentinel: lookup never made (a cached None means "not found")
+_cache_connection = None
+
+
+def get_cache_connection() -> sqlite3.Connection:
+    """Return the connection to the lookup cache, creating the database on first use."""
+    global _cache_connection
+    if _cache_connection is None:
+        _cache_connection = sqlite3.connect(CACHE_DB_PATH)
+        # WAL with NORMAL sync skips the fsync per commit; a lost cache row is just refetched
+        _cache_connection.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;")
+        _cache_connection.execute("""
+            CREATE TABLE IF NOT EXISTS gb_cache (
+                title      TEXT    NOT NULL,
+                author     TEXT    NOT NULL,
+                fetched_at INTEGER NOT NULL,
+                payload    BLOB    NOT NULL,
+                PRIMARY KEY (title, author)
+            )
+        """)
+    return _cache_connection
+
+
+def load_cached_search(title: str, author: str = None):
+    """Return the cached search result for a title/author, or CACHE_MISS if there is none.
+
+    "Not found" results expire after NOT_FOUND_CACHE_TTL so books added to
+    Google Books later are picked up; found results are kept.
+    """
+    row = get_cache_connection().execute(
+        "SELECT payload, fetched_at FROM gb_cache WHERE title = ? AND author = ?",
+        (title, author or "")
+    ).fetchone()
+    if row is None:
+        return CACHE_MISS
+    payload, fetched_at = row
+    if payload == b"null" and time.time() - fetched_at > NOT_FOUND_CACHE_TTL:
+        return CACHE_MISS
+    return orjson.loads(payload)
+
+
+def store_cached_searches(searches: List[tuple]):
+    """Store (title, author, book_data) search results in the lookup cache in one transaction."""
+    fetched_at = int(time.time())
+    conn = get_cache_connection()
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO gb_cache (title, author, fetched_at, payload) VALUES (?, ?, ?, ?)",
+            [(title, author or "", fetched_at, orjson.dumps(book_data)) for title, author, book_data in searches]
+        )
+
+
+def build_search_params(title: str, author: str = None) -> Dict:
+    """Build the Google Books query parameters for a title/author search."""
+    if author:
+        query = f"intitle:{title} inauthor:{author}"
+    else:
+        query = f"intitle:{title}"
+
+    return {
+        "q": query,
+        "maxResults": 1
+    }
+
+
+def normalize_search_key(title: str, author: str = None) -> tuple:
+    """Normalize a title/author pair so trivially different spellings share one lookup."""
+    title = LEADING_ARTICLE.sub("", title.strip().casefold())
+    author = (author or "").casefold()
+    return NON_WORD.sub("", title), NON_WORD.sub("", author)
+
+
+def parse_search_response(response: httpx.Response, title: str) -> Optional[Dict]:
+    """Return the first volume from a search response or None if there are no results.
+
+    Raises httpx.HTTPStatusError for error statuses and ValueError for a body that is not JSON.
+    """
+    response.raise_for_status()
+
+    data = response.json()
+
+    if data.get("totalItems", 0) > 0:
+        return data["items"][0]
+    else:
+        print(f"  ❌ No results found for: {title}")
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def fetch_google_books(title: str, author: str = None) -> Optional[Dict]:
+    """
+    Look up a book in the cache, falling back to the Google Books API.
+
+    Results are memoized for the process and stored in the SQLite cache.
+    HTTP errors and undecodable bodies (ValueError) propagate, so failed
+    lookups are retried on the next call.
+    """
+    cached = load_cached_search(title, author)
+    if cached is not CACHE_MISS:
+        return cached
+
+    params = build_search_params(title, author)
+    response = httpx.get(GOOGLE_BOOKS_API_BASE, params=params, timeout=REQUEST_TIMEOUT)
+    book_data = parse_search_response(response, title)
+
+    store_cached_searches([(title, author, book_data)])
+    return book_data
 
 
 def search_google_books(title: str, author: str = None) -> Optional[Dict]:
@@ -19,34 +142,49 @@ def search_google_books(title: str, author: str = None) -> Optional[Dict]:
     Returns:
         Dictionary with book information or None if not found
     """
-    # Build search query
-    if author:
-        query = f"intitle:{title} inauthor:{author}"
-    else:
-        query = f"intitle:{title}"
-    
-    params = {
-        "q": query,
-        "maxResults": 1
-    }
-    
     try:
-        response = requests.get(GOOGLE_BOOKS_API_BASE, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        if data.get("totalItems", 0) > 0:
-            return data["items"][0]
-        else:
-            print(f"  ❌ No results found for: {title}")
-            return None
-            
-    except requests.exceptions.RequestException as e:
+        return fetch_google_books(title, author)
+    except (httpx.HTTPError, ValueError) as e:
+        # ValueError: a 200 response whose body is not JSON (e.g. an HTML quota page)
         print(f"  ❌ Error fetching data: {e}")
         return None
 
 
+async def search_google_books_async(client: httpx.AsyncClient, title: str, author: str = None,
+                                    cache_rows: List[tuple] = None) -> Optional[Dict]:
+    """
+    Search for a book on Google Books API using a shared async client.
+
+    The result is stored in the lookup cache; callers check the cache first
+    so that hits don't wait for a rate limit token.
+
+    Args:
+        client: Open AsyncClient whose connection pool is reused across requests
+        title: Book title
+        author: Book author (optional, improves accuracy)
+        cache_rows: If given, the result is appended here for a batched cache
+            write instead of being stored immediately
+
+    Returns:
+        Dictionary with book information or None if not found
+    """
+    params = build_search_params(title, author)
+
+    try:
+        response = await client.get(GOOGLE_BOOKS_API_BASE, params=params)
+        book_data = parse_search_response(response, title)
+    except (httpx.HTTPError, ValueError) as e:
+        # ValueError: a 200 response whose body is not JSON (e.g. an HTML quota page)
+        print(f"  ❌ Error fetching data for {title}: {e}")
+        return None
+
+    if cache_rows is not None:
+        cache_rows.append((title, author, book_data))
+    else:
+        store_cached_searches([(title, author, book_data)])
+    return book_data
+
+
 def extract_genre_info(book_data: Dict) -> Dict:
     """
     Extract genre/category information from Google Books API response.
@@ -72,11 +210,9 @@ def extract_genre_info(book_data: Dict) -> Dict:
 
 def extract_isbn(volume_info: Dict) -> Optional[str]:
     """Extract ISBN from volume info."""
-    identifiers = volume_info.get("industryIdentifiers", [])
-    for identifier in identifiers:
-        if identifier.get("type") in ["ISBN_13", "ISBN_10"]:
-            return identifier.get("identifier")
-    return None
+    identifiers = volume_info.get("industryIdentifiers", ())
+    return next((identifier.get("identifier") for identifier in identifiers
+                 if identifier.get("type") in ISBN_TYPES), None)
 
 
 def test_single_book(title: str, author: str = None):
@@ -108,21 +244,57 @@ def test_single_book(title: str, author: str = None):
         return None
 
 
-def test_multiple_books(books: List[Dict]):
-    """Test fetching genres for multiple books."""
+async def test_multiple_books(books: List[Dict]):
+    """Test fetching genres for multiple books, issuing the requests concurrently."""
     print(f"\n{'='*60}")
     print(f"Testing {len(books)} books")
     print('='*60)
     
+    # Search each normalized title/author once and share the result with its duplicates
+    keys = []
+    unique_books = {}
+    for i, book in enumerate(books):
+        key = normalize_search_key(book['title'], book.get('author'))
+        if not key[0]:
+            # Nothing of the title survives normalization; never merge it with other books
+            key = (i,)
+        keys.append(key)
+        unique_books.setdefault(key, book)
+    if len(unique_books) < len(books):
+        print(f"♻️  Skipping {len(books) - len(unique_books)} duplicate searches")
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    limiter = AsyncLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_PERIOD)
+    limits = httpx.Limits(max_keepalive_connections=MAX_CONNECTIONS, max_connections=MAX_CONNECTIONS)
+    cache_rows = []
+
+    async with httpx.AsyncClient(http2=True, timeout=REQUEST_TIMEOUT, limits=limits) as client:
+        async def bounded_search(book: Dict) -> Optional[Dict]:
+            cached = load_cached_search(book['title'], book.get('author'))
+            if cached is not CACHE_MISS:
+                return cached
+
+            async with semaphore, limiter:
+                return await search_google_books_async(client, book['title'], book.get('author'), cache_rows)
+
+        unique_datas = await asyncio.gather(*(bounded_search(book) for book in unique_books.values()))
+
+    if cache_rows:
+        store_cached_searches(cache_rows)
+
+    # Extract each distinct response once; duplicate books share the extracted info
+    infos_by_key = {
+        key: extract_genre_info(book_data) if book_data else None
+        for key, book_data in zip(unique_books, unique_datas)
+    }
+    
     results = []
     
-    for i, book in enumerate(books, 1):
+    for i, (book, key) in enumerate(zip(books, keys), 1):
         print(f"\n[{i}/{len(books)}] Processing: {book['title']}")
         
-        book_data = search_google_books(book['title'], book.get('author'))
-        
-        if book_data:
-            info = extract_genre_info(book_data)
+        info = infos_by_key[key]
+        if info:
             results.append({
                 "original": book,
                 "found": info
@@ -136,9 +308,6 @@ def test_multiple_books(books: List[Dict]):
                 "found": None
             })
             print(f"  ❌ Not found")
-        
-        # Rate limiting
-        time.sleep(REQUEST_DELAY)
     
     return results
 
@@ -174,8 +343,8 @@ def print_summary(results: List[Dict]):
 
 def save_results(results: List[Dict], filename: str = "genre_test_results.json"):
     """Save results to JSON file."""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     print(f"\n💾 Results saved to: {filename}")
 
 
@@ -207,7 +376,7 @@ def main():
         {"title": "The Hunger Games", "author": "Suzanne Collins"},
     ]
     
-    results = test_multiple_books(test_books)
+    results = asyncio.run(test_multiple_books(test_books))
     
     # Print summary
     print_summary(results)
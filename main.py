@@ -1,12 +1,24 @@
 import sqlite3
-import json
+import orjson
 import os
 import csv
 import sys
 import argparse
+import asyncio
+import io
+from contextlib import closing
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
 from tqdm import tqdm
 from PIL import Image
-import hashlib
+import blake3
+
+try:
+    import pyvips
+except (ImportError, OSError):
+    # libvips is optional; fall back to Pillow when it is not installed
+    pyvips = None
 
 
 # === CONFIGURATION ===
@@ -18,6 +30,16 @@ LANGUAGES_OUTPUT_PATH = "languages.json"
 OUTPUT_COVER_FOLDER = "covers"
 MAX_COVER_WIDTH = 400
 COVER_QUALITY = 80
+COLOR_SWATCH_SIZE = (32, 48)  # Width, height of the downsampled cover used for average colors
+COVER_IO_THREADS = 4  # Threads reading and hashing source covers while workers render
+
+CSV_FIELDNAMES = ("id", "author", "title", "series", "series_index", "cover_path", "is_read", "language")
+
+# File headers of the image formats covers are expected in (WebP is matched separately)
+IMAGE_SIGNATURES = (b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n", b"GIF87a", b"GIF89a")
+
+# Cover fields carried over from the previous JSON export so unchanged covers can be skipped
+CACHED_COVER_FIELDS = ("cover_hash", "cover_sig", "cover_color")
 
 # Global verbose flag
 VERBOSE = False
@@ -37,6 +59,7 @@ Examples:
   python main.py --skip-covers            # Don't process covers
   python main.py --quality 90             # Use higher quality for covers
   python main.py --max-width 600          # Larger cover size
+  python main.py --workers 4              # Limit cover processing to 4 processes
   python main.py -v --skip-csv            # Combine multiple options
         """
     )
@@ -89,7 +112,18 @@ Examples:
         help='Force reprocessing of all covers (ignore hash cache)'
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Number of cover processing worker processes (default: number of CPUs)'
+    )
+
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
 
 
 # === UTILITY FUNCTIONS ===
@@ -100,18 +134,19 @@ def log_verbose(message):
         print(f"  [VERBOSE] {message}")
 
 
-def sha256_of_file(path: str, chunk_size: int = 8192) -> str:
-    """Calculate SHA256 hash of a file."""
-    log_verbose(f"Calculating hash for: {path}")
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
-    hash_value = h.hexdigest()
+def fingerprint_of_data(data: bytes) -> str:
+    """Calculate the BLAKE3 fingerprint of file contents (change detection only, not security)."""
+    # blake3 releases the GIL for large inputs, so I/O threads can hash in parallel
+    hash_value = blake3.blake3(data).hexdigest()
     log_verbose(f"Hash: {hash_value}")
     return hash_value
 
 
+def has_image_signature(data: bytes) -> bool:
+    """Check the file header for a known image format without decoding anything."""
+    return data.startswith(IMAGE_SIGNATURES) or (data[:4] == b"RIFF" and data[8:12] == b"WEBP")
+
+
 def validate_calibre_library(library_path):
     """Validate that the Calibre library exists."""
     db_path = os.path.join(library_path, "metadata.db")
@@ -131,49 +166,72 @@ def setup_output_folders():
 
 # === DATABASE FUNCTIONS ===
 
-def fetch_books_from_db(db_path):
-    """Fetch all books from Calibre database."""
+def open_database(db_path):
+    """Open a connection to the Calibre database with named column access."""
     log_verbose(f"Connecting to database: {db_path}")
     conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    # Per-connection read tuning: in-memory temp tables for the sort, and
+    # memory-mapped pages so reads come straight from the OS page cache
+    conn.executescript("PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456;")
+    return conn
+
+
+def fetch_books_from_db(conn, library_path):
+    """Fetch all books from Calibre database."""
     cursor = conn.cursor()
 
     log_verbose("Executing query to fetch books...")
     cursor.execute("""
+                   WITH book_authors AS (SELECT books_authors_link.book,
+                                                group_concat(authors.name, ', ') AS authors
+                                         FROM books_authors_link
+                                                  JOIN authors ON books_authors_link.author = authors.id
+                                         GROUP BY books_authors_link.book),
+                        -- Bare column with min(): SQLite returns the lang_code of the primary language
+                        book_languages AS (SELECT books_languages_link.book,
+                                                  languages.lang_code,
+                                                  min(books_languages_link.item_order)
+                                           FROM books_languages_link
+                                                    JOIN languages ON books_languages_link.lang_code = languages.id
+                                           GROUP BY books_languages_link.book)
                    SELECT books.id,
                           books.title,
-                          group_concat(authors.name, ', ') AS authors,
+                          book_authors.authors,
                           series.name                      AS series,
                           books.series_index,
                           books.path                       AS book_folder,
+                          books.has_cover,
                           COALESCE(custom_column_1.value, 0) AS is_read,
-                          languages.lang_code              AS language
+                          book_languages.lang_code         AS language
                    FROM books
-                            LEFT JOIN books_authors_link ON books.id = books_authors_link.book
-                            LEFT JOIN authors ON books_authors_link.author = authors.id
+                            LEFT JOIN book_authors ON books.id = book_authors.book
                             LEFT JOIN books_series_link ON books.id = books_series_link.book
                             LEFT JOIN series ON books_series_link.series = series.id
                             LEFT JOIN custom_column_1 ON books.id = custom_column_1.book
-                            LEFT JOIN books_languages_link ON books.id = books_languages_link.book
-                            LEFT JOIN languages ON books_languages_link.lang_code = languages.id
-                   GROUP BY books.id
-                   ORDER BY authors, series, books.title
+                            LEFT JOIN book_languages ON books.id = book_languages.book
+                   ORDER BY book_authors.authors, series, books.title
                    """)
 
+    # Same result as os.path.join(library_path, book_folder, "cover.jpg"), without the per-row call
+    library_prefix = os.path.join(library_path, "")
+    _isfile = os.path.isfile  # Looked up once instead of per book
+
     books = []
-    for row in cursor.fetchall():
-        book_id = row[0]
-        title = row[1]
-        authors = row[2]
-        series = row[3] if row[3] else ''
-        series_index = row[4] if row[4] is not None else ''
-        book_folder = row[5]
-        is_read = row[6]
-        language = row[7] if row[7] else ''
-
-        # Full path to cover
-        library_path = os.path.dirname(db_path)
-        cover_path = os.path.join(library_path, book_folder, "cover.jpg")
-        if not os.path.exists(cover_path):
+    for row in cursor:
+        book_id = row["id"]
+        title = row["title"]
+        authors = row["authors"]
+        series = row["series"] if row["series"] else ''
+        series_index = row["series_index"] if row["series_index"] is not None else ''
+        book_folder = row["book_folder"]
+        is_read = row["is_read"]
+        language = row["language"] if row["language"] else ''
+
+        # Full path to cover; Calibre's has_cover flag skips the stat for
+        # books without one, but a stale flag must not yield a missing path
+        cover_path = f"{library_prefix}{book_folder}{os.sep}cover.jpg" if row["has_cover"] else ""
+        if not (cover_path and _isfile(cover_path)):
             cover_path = ""
             log_verbose(f"Cover not found for book {book_id}: {title}")
 
@@ -188,15 +246,12 @@ def fetch_books_from_db(db_path):
             "language": language
         })
 
-    conn.close()
     print(f"✅ Fetched {len(books)} books from database")
     return books
 
 
-def fetch_languages_from_db(db_path):
+def fetch_languages_from_db(conn):
     """Fetch distinct languages from Calibre database."""
-    log_verbose(f"Connecting to database: {db_path}")
-    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     log_verbose("Executing query to fetch languages...")
@@ -206,8 +261,7 @@ def fetch_languages_from_db(db_path):
                    ORDER BY languages.lang_code
                    """)
 
-    languages = [row[0] for row in cursor.fetchall() if row[0]]
-    conn.close()
+    languages = [row["lang_code"] for row in cursor if row["lang_code"]]
 
     print(f"✅ Found {len(languages)} distinct languages")
     log_verbose(f"Languages: {languages}")
@@ -234,10 +288,10 @@ def export_to_csv(books):
         return
 
     log_verbose(f"Writing {len(books)} books to CSV...")
-    with open(CSV_OUTPUT_PATH, mode="w", newline='', encoding="utf-8") as file:
-        writer = csv.DictWriter(file, fieldnames=books[0].keys())
-        writer.writeheader()
-        writer.writerows(books)
+    with open(CSV_OUTPUT_PATH, mode="w", newline='', encoding="utf-8", buffering=1024 * 1024) as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(map(itemgetter(*CSV_FIELDNAMES), books))
 
     print(f"✅ Exported to {CSV_OUTPUT_PATH}")
 
@@ -245,8 +299,8 @@ def export_to_csv(books):
 def save_books_to_json(books):
     """Save books data to JSON file."""
     log_verbose(f"Writing {len(books)} books to JSON...")
-    with open(JSON_OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(books, f, ensure_ascii=False, indent=2)
+    with open(JSON_OUTPUT_PATH, "wb") as f:
+        f.write(orjson.dumps(books, option=orjson.OPT_INDENT_2))
 
     print(f"✅ Exported to {JSON_OUTPUT_PATH}")
 
@@ -254,8 +308,8 @@ def save_books_to_json(books):
 def save_languages_to_json(languages):
     """Save languages to JSON file."""
     log_verbose(f"Writing {len(languages)} languages to JSON...")
-    with open(LANGUAGES_OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(languages, f, ensure_ascii=False, indent=2)
+    with open(LANGUAGES_OUTPUT_PATH, "wb") as f:
+        f.write(orjson.dumps(languages, option=orjson.OPT_INDENT_2))
 
     print(f"✅ Exported {len(languages)} languages to {LANGUAGES_OUTPUT_PATH}")
     if languages:
@@ -265,110 +319,284 @@ def save_languages_to_json(languages):
 def load_books_from_json():
     """Load books from JSON file."""
     log_verbose(f"Reading books from {JSON_OUTPUT_PATH}...")
-    with open(JSON_OUTPUT_PATH, "r", encoding="utf-8") as f:
-        books = json.load(f)
+    with open(JSON_OUTPUT_PATH, "rb") as f:
+        books = orjson.loads(f.read())
 
     print(f"✅ Loaded {len(books)} books from {JSON_OUTPUT_PATH}")
     return books
 
 
+def load_cover_cache():
+    """Load cached cover fields from the previous JSON export, keyed by book ID."""
+    if not os.path.isfile(JSON_OUTPUT_PATH):
+        log_verbose(f"No previous {JSON_OUTPUT_PATH}, cover cache is empty")
+        return {}
+
+    # An interrupted or hand-edited export only costs the cache, not the run
+    try:
+        with open(JSON_OUTPUT_PATH, "rb") as f:
+            previous_books = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(f"⚠️  Could not read previous {JSON_OUTPUT_PATH}, cover cache is empty: {e}")
+        return {}
+
+    cache = {
+        book["id"]: {field: book[field] for field in CACHED_COVER_FIELDS if field in book}
+        for book in previous_books
+    }
+    log_verbose(f"Loaded cover cache for {len(cache)} books")
+    return cache
+
+
+def apply_cover_cache(books, cover_cache):
+    """Copy cached cover fields from the previous export onto freshly fetched books."""
+    for book in books:
+        book.update(cover_cache.get(book["id"], {}))
+
+
+def clear_cover_cache(book):
+    """Drop cached cover fields from a book whose cover is missing or failed to process."""
+    for field in CACHED_COVER_FIELDS:
+        book.pop(field, None)
+
+
 # === COVER PROCESSING FUNCTIONS ===
 
-def calculate_average_color(img):
-    """Calculate average color of an image."""
-    avg_color = img.resize((1, 1)).getpixel((0, 0))
-    log_verbose(f"Average color: RGB{avg_color}")
-    return avg_color
+def calculate_average_colors(swatches):
+    """Calculate average colors for a batch of equally sized RGB swatches in one NumPy pass."""
+    thumbs = np.stack(swatches)
+    colors = thumbs.reshape(len(thumbs), -1, 3).mean(axis=1).round().astype(np.uint8)
+    return colors.tolist()
+
+
+def resize_cover_with_pil(data, new_cover_path, quality, max_width):
+    """Resize and convert cover bytes to WebP with Pillow, returning a color swatch array."""
+    with Image.open(io.BytesIO(data)) as img:
+        original_size = img.size
+        log_verbose(f"Original image size: {original_size}")
+
+        # Let libjpeg decode at a reduced DCT scale; no-op for other formats
+        img.draft("RGB", (max_width * 2, max_width * 2))
+
+        img = img.convert("RGB")
+
+        # Resize if needed
+        if img.width > max_width:
+            ratio = max_width / img.width
+            new_size = (max_width, int(img.height * ratio))
+            # reducing_gap box-reduces by an integer factor before LANCZOS once
+            # the image is at least 2x reducing_gap too wide, i.e. when draft()
+            # could not get close (non-JPEG covers)
+            img = img.resize(new_size, Image.LANCZOS, reducing_gap=2.0)
+            log_verbose(f"Resized to: {new_size}")
+        else:
+            log_verbose("No resize needed")
+
+        # Save as WebP
+        img.save(new_cover_path, "WEBP", quality=quality)
+        file_size = os.path.getsize(new_cover_path)
+        log_verbose(f"Saved as WebP: {file_size} bytes (quality={quality})")
+
+        return np.asarray(img.resize(COLOR_SWATCH_SIZE, Image.BOX))
+
+
+def resize_cover_with_vips(data, new_cover_path, quality, max_width):
+    """Resize and convert cover bytes to WebP with libvips, returning a color swatch array."""
+    # Match the Pillow path: the huge height bound limits only the width,
+    # size="down" never upscales and no_rotate ignores EXIF orientation
+    options = dict(height=10_000_000, size="down", no_rotate=True)
+
+    # Only reads the header; pixels are decoded by the thumbnail call below
+    source = pyvips.Image.new_from_buffer(data, "", access="sequential")
+    if source.hasalpha():
+        # Drop alpha before resizing, as Pillow's convert("RGB") does, instead
+        # of letting thumbnail premultiply it or flatten() composite onto black
+        img = source.extract_band(0, n=source.bands - 1).thumbnail_image(max_width, **options)
+    else:
+        # thumbnail_buffer() shrinks JPEGs while decoding
+        img = pyvips.Image.thumbnail_buffer(data, max_width, **options)
+    if img.interpretation != "srgb":
+        img = img.colourspace("srgb")
+
+    # Render once so saving and averaging don't each rerun the pipeline
+    img = img.copy_memory()
+    log_verbose(f"Resized to: {(img.width, img.height)}")
+
+    # Save as WebP
+    img.webpsave(new_cover_path, Q=quality)
+    file_size = os.path.getsize(new_cover_path)
+    log_verbose(f"Saved as WebP: {file_size} bytes (quality={quality})")
+
+    swatch_width, swatch_height = COLOR_SWATCH_SIZE
+    swatch = img.thumbnail_image(swatch_width, height=swatch_height, size="force")
+    return np.ndarray(buffer=swatch.write_to_memory(), dtype=np.uint8, shape=(swatch_height, swatch_width, 3))
+
+
+def init_cover_worker(verbose):
+    """Initialize a cover worker process with the parent's verbose setting."""
+    global VERBOSE
+    VERBOSE = verbose
+
 
+def read_cover_source(book, original_cover, book_id, force_reprocess=False):
+    """Decide whether a cover needs processing and, if so, read its bytes.
 
-def process_single_cover(book, original_cover, book_id, quality, max_width, force_reprocess=False):
-    """Process a single book cover: resize and convert."""
+    Runs in an I/O thread. Returns (status, data, cover_sig, current_hash),
+    where status is None when the cover still has to be rendered, or
+    "skipped", "missing" or "failed" when there is nothing more to do.
+    """
     new_cover_path = os.path.join(OUTPUT_COVER_FOLDER, f"{book_id}.webp")
 
     log_verbose(f"Processing cover for book {book_id}: {book.get('title', 'Unknown')}")
 
-    # Calculate hash of source file
-    current_hash = None
-    if original_cover and os.path.exists(original_cover):
+    # Stat the source file once; a missing file is reported below
+    cover_sig = None
+    if original_cover:
         try:
-            current_hash = sha256_of_file(original_cover)
-        except Exception as e:
-            print(f"❌ Error hashing cover for book ID {book_id}: {e}")
-            return None, "failed"
+            st = os.stat(original_cover)
+            cover_sig = [st.st_mtime_ns, st.st_size]
+        except FileNotFoundError:
+            pass
 
-    # Skip if already processed and unchanged
-    previous_hash = book.get("cover_hash")
-    if not force_reprocess and os.path.exists(new_cover_path) and current_hash and previous_hash == current_hash:
-        book["cover_path"] = f"covers/{book_id}.webp"
-        log_verbose(f"Skipping book {book_id}: hash unchanged")
-        return None, "skipped"
-
-    # Process the cover
-    if not original_cover or not os.path.exists(original_cover):
+    if not cover_sig:
         book["cover_path"] = ""
+        clear_cover_cache(book)
         log_verbose(f"Missing cover for book {book_id}")
-        return None, "missing"
+        return "missing", None, None, None
 
-    try:
-        with Image.open(original_cover) as img:
-            original_size = img.size
-            log_verbose(f"Original image size: {original_size}")
+    # Skip without reading if size and modification time are unchanged
+    if not force_reprocess and book.get("cover_sig") == cover_sig and os.path.exists(new_cover_path):
+        book["cover_path"] = f"covers/{book_id}.webp"
+        log_verbose(f"Skipping book {book_id}: size and modification time unchanged")
+        return "skipped", None, cover_sig, None
 
-            img = img.convert("RGB")
+    # Read and hash the source file
+    try:
+        with open(original_cover, "rb", buffering=0) as f:
+            data = f.read()
+        if not has_image_signature(data):
+            print(f"❌ Cover for book ID {book_id} is not a valid image: {original_cover}")
+            book["cover_path"] = ""
+            clear_cover_cache(book)
+            return "failed", None, cover_sig, None
+        current_hash = fingerprint_of_data(data)
+    except Exception as e:
+        print(f"❌ Error reading cover for book ID {book_id}: {e}")
+        clear_cover_cache(book)
+        return "failed", None, cover_sig, None
 
-            # Resize if needed
-            if img.width > max_width:
-                ratio = max_width / img.width
-                new_size = (max_width, int(img.height * ratio))
-                img = img.resize(new_size, Image.LANCZOS)
-                log_verbose(f"Resized to: {new_size}")
-            else:
-                log_verbose("No resize needed")
+    # Skip if already processed and unchanged
+    if not force_reprocess and os.path.exists(new_cover_path) and book.get("cover_hash") == current_hash:
+        book["cover_path"] = f"covers/{book_id}.webp"
+        book["cover_sig"] = cover_sig
+        log_verbose(f"Skipping book {book_id}: hash unchanged")
+        return "skipped", None, cover_sig, current_hash
 
-            # Save as WebP
-            img.save(new_cover_path, "WEBP", quality=quality)
-            file_size = os.path.getsize(new_cover_path)
-            log_verbose(f"Saved as WebP: {file_size} bytes (quality={quality})")
+    return None, data, cover_sig, current_hash
 
-            # Update book data
-            book["cover_path"] = f"covers/{book_id}.webp"
-            if current_hash:
-                book["cover_hash"] = current_hash
 
-            # Calculate average color
-            avg_color = calculate_average_color(img)
-            book["cover_color"] = avg_color
+def render_cover(data, book_id, quality, max_width):
+    """Resize and convert one cover's bytes to WebP, returning a color swatch or None on failure.
 
-            return book, "success"
+    Runs in a worker process and only exchanges bytes and arrays with the
+    parent, so no book dicts or library objects cross the process boundary.
+    """
+    new_cover_path = os.path.join(OUTPUT_COVER_FOLDER, f"{book_id}.webp")
 
+    try:
+        if pyvips is not None:
+            return resize_cover_with_vips(data, new_cover_path, quality, max_width)
+        return resize_cover_with_pil(data, new_cover_path, quality, max_width)
     except Exception as e:
         print(f"❌ Error processing book ID {book_id}: {e}")
+        return None
+
+
+async def process_single_cover(book, quality, max_width, force_reprocess, io_pool, cpu_pool, semaphore):
+    """Process a single book cover: read it in an I/O thread, then render it in a worker process.
+
+    Returns (status, swatch); successfully processed covers return a small
+    RGB swatch that the caller averages with all the others to fill in
+    cover_color.
+    """
+    loop = asyncio.get_running_loop()
+    book_id = book["id"]
+
+    # The semaphore bounds how many read-but-unrendered covers sit in memory
+    async with semaphore:
+        status, data, cover_sig, current_hash = await loop.run_in_executor(
+            io_pool, read_cover_source, book, book["cover_path"], book_id, force_reprocess)
+        if status:
+            return status, None
+
+        swatch = await loop.run_in_executor(cpu_pool, render_cover, data, book_id, quality, max_width)
+
+    if swatch is None:
         book["cover_path"] = ""
-        return book, "failed"
+        clear_cover_cache(book)
+        return "failed", None
 
+    # Update book data
+    book["cover_path"] = f"covers/{book_id}.webp"
+    book["cover_hash"] = current_hash
+    book["cover_sig"] = cover_sig
+    return "success", swatch
 
-def process_all_covers(books, quality, max_width, force_reprocess=False):
-    """Process all book covers: resize, convert to WebP, and calculate colors."""
+
+async def process_all_covers_async(books, quality, max_width, force_reprocess=False, workers=None):
+    """Pipeline cover processing so reading the next covers overlaps with rendering the current ones."""
     copied = 0
     skipped = 0
     failed = 0
+    swatch_books = []
+    swatches = []
+
+    workers = workers or os.cpu_count() or 1
+    semaphore = asyncio.Semaphore(workers * 2)
+
+    with ThreadPoolExecutor(max_workers=COVER_IO_THREADS) as io_pool, \
+            ProcessPoolExecutor(max_workers=workers, initializer=init_cover_worker, initargs=(VERBOSE,)) as cpu_pool:
+
+        async def process_with_book(book):
+            return book, await process_single_cover(book, quality, max_width, force_reprocess,
+                                                    io_pool, cpu_pool, semaphore)
+
+        tasks = [process_with_book(book) for book in books]
+
+        # Skipped covers finish in microseconds, so redraw the bar ~100 times at most
+        with tqdm(total=len(tasks), desc="Processing covers", unit="book", disable=VERBOSE,
+                  miniters=max(1, len(tasks) // 100), mininterval=0.5) as progress:
+            for next_done in asyncio.as_completed(tasks):
+                book, (status, swatch) = await next_done
 
+                if status == "success":
+                    copied += 1
+                    swatch_books.append(book)
+                    swatches.append(swatch)
+                elif status == "skipped":
+                    skipped += 1
+                elif status in ["failed", "missing"]:
+                    failed += 1
+
+                progress.update(1)
+
+    # Average all new covers' colors in a single pass
+    if swatches:
+        for book, color in zip(swatch_books, calculate_average_colors(swatches)):
+            book["cover_color"] = color
+            log_verbose(f"Average color for book {book['id']}: RGB{tuple(color)}")
+
+    return copied, skipped, failed
+
+
+def process_all_covers(books, quality, max_width, force_reprocess=False, workers=None):
+    """Process all book covers in parallel: resize, convert to WebP, and calculate colors."""
     print(f"\n📦 Processing {len(books)} covers (max width {max_width}px, quality {quality})...")
     if force_reprocess:
         print("   Force reprocess enabled - ignoring cache")
 
-    for book in tqdm(books, desc="Processing covers", unit="book", disable=VERBOSE):
-        original_cover = book["cover_path"]
-        book_id = book["id"]
-
-        result, status = process_single_cover(book, original_cover, book_id, quality, max_width, force_reprocess)
-
-        if status == "success":
-            copied += 1
-        elif status == "skipped":
-            skipped += 1
-        elif status in ["failed", "missing"]:
-            failed += 1
+    copied, skipped, failed = asyncio.run(
+        process_all_covers_async(books, quality, max_width, force_reprocess, workers))
 
     # Print summary
     print("\n✅ Cover processing summary:")
@@ -402,6 +630,7 @@ def main():
         print(f"  Cover quality: {args.quality}")
         print(f"  Max width: {args.max_width}")
         print(f"  Force reprocess: {args.force_reprocess}")
+        print(f"  Workers: {args.workers or os.cpu_count()}")
         print("=" * 60)
         print()
 
@@ -409,9 +638,10 @@ def main():
     db_path = validate_calibre_library(args.library_path)
     setup_output_folders()
 
-    # Fetch data from database
-    books = fetch_books_from_db(db_path)
-    languages = fetch_languages_from_db(db_path)
+    # Fetch data from database over a single connection
+    with closing(open_database(db_path)) as conn:
+        books = fetch_books_from_db(conn, os.path.dirname(db_path))
+        languages = fetch_languages_from_db(conn)
 
     # Export initial data
     print_books_to_terminal(books)
@@ -421,13 +651,17 @@ def main():
     else:
         print("⏭️  Skipping CSV export")
 
+    # Keep cover hashes and colors from the previous run before books.json is overwritten
+    cover_cache = load_cover_cache() if not args.skip_covers else {}
+
     save_books_to_json(books)
     save_languages_to_json(languages)
 
     # Process covers
     if not args.skip_covers:
         books = load_books_from_json()
-        books = process_all_covers(books, args.quality, args.max_width, args.force_reprocess)
+        apply_cover_cache(books, cover_cache)
+        books = process_all_covers(books, args.quality, args.max_width, args.force_reprocess, args.workers)
         save_books_to_json(books)
     else:
         print("⏭️  Skipping cover processing")